@@ -38,7 +38,10 @@ import shutil
 import json
 import re
 import time
+import itertools
 import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache, lru_cache
 
 # -------------------------------
 # Basic environment checks
@@ -63,16 +66,33 @@ except (ModuleNotFoundError, ImportError, ValueError):
     print("    sudo pacman -S python-gobject gtk4 libadwaita")
     sys.exit(1)
 
+try:
+    # Optional: in-process access to the pacman database (no fork/exec).
+    # Everything works without it via the pacman CLI.
+    import pyalpm
+except ImportError:
+    pyalpm = None
+
 # =========================================================
 # CONFIGURATION
 # =========================================================
 HOME = os.path.expanduser("~")
 APP_ID = "sk.mayday.OrphyCleaner"
 
+CONFIG_DIR = os.path.join(HOME, ".config")
+LOCAL_SHARE_DIR = os.path.join(HOME, ".local", "share")
+# Hidden home entries scanned through CONFIG_DIR/LOCAL_SHARE_DIR already.
+_EXCLUDED_HIDDEN = frozenset((".config", ".local"))
+
 CACHE_FILE    = os.path.join(HOME, ".cache", "orphycleaner", "orphycleaner_pkg_cache.json")
+SOURCE_CACHE_FILE = os.path.join(HOME, ".cache", "orphycleaner", "source_index.json")
 KEPT_FILE     = os.path.join(HOME, ".local", "share", "orphycleaner", "kept_folders.txt")
 SETTINGS_FILE = os.path.join(HOME, ".local", "share", "orphycleaner", "settings.json")
 
+# How many rows the folder list materializes at a time; more are appended
+# as the user scrolls, so huge categories never stall the category switch.
+LIST_CHUNK_SIZE = 300
+
 SUBPROCESS_ENV = os.environ.copy()
 SUBPROCESS_ENV["LANG"] = "C"
 SUBPROCESS_ENV["LC_ALL"] = "C"
@@ -104,6 +124,10 @@ IGNORED_FOLDERS = [
     f"{HOME}/.local/share/flatpak/runtime",
     f"{HOME}/.config/autostart",
 ]
+# Precomputed at import: exact matches are one hash lookup, prefix matches
+# one C-level str.startswith over a tuple, instead of a Python loop per folder.
+_IGNORED_SET = frozenset(IGNORED_FOLDERS)
+_IGNORED_PREFIXES = tuple(p + "/" for p in IGNORED_FOLDERS)
 
 ALIAS_MAP = {
     ".audacity-data": "audacity",
@@ -136,47 +160,150 @@ CATEGORY_ICONS = {
     "Orphaned": "user-trash-symbolic",
     "Kept": "starred-symbolic",
 }
-CATEGORY_ORDER = list(CATEGORY_STYLES.keys())
+CATEGORY_ORDER = tuple(CATEGORY_STYLES.keys())
 
 
 # =========================================================
 # HELPER FUNCTIONS (unchanged from the Tkinter version - pure logic,
 # no GUI toolkit dependency)
 # =========================================================
-def normalize(name):
-    return name.lower().replace(' ', '-').replace('_', '-').replace('.', '-')
+# normalize() runs once per installed package at startup and once per folder
+# during scanning; a single translate pass beats three chained replace calls.
+_NORM_TABLE = str.maketrans({' ': '-', '_': '-', '.': '-'})
+
+
+@lru_cache(maxsize=4096)
+def normalize(name, _table=_NORM_TABLE):
+    # The table is bound as a default argument so the hot loops over
+    # thousands of package names skip the module-global lookup per call.
+    # Folder scans and candidate derivation hit the same names repeatedly,
+    # so recent results are memoized.
+    return name.lower().translate(_table)
 
 
 def is_ignored(folder):
-    return any(folder == ignored or folder.startswith(ignored + "/") for ignored in IGNORED_FOLDERS)
+    return folder in _IGNORED_SET or folder.startswith(_IGNORED_PREFIXES)
 
 
-def get_installed_packages():
+# Compiled once: matched against every output line during description
+# parsing ("Popis" is the label pacman prints under Slovak locales).
+_DESC_LABEL_RE = re.compile(r"^\s*(?:description|popis)\s*:\s*(.*)$", re.I)
+
+# ALIAS_MAP keys normalized once at import, so per-folder alias lookups are
+# a single dict probe on the already-normalized name instead of normalizing
+# both sides per query.
+_ALIAS_MAP = {normalize(k.lstrip('.')): v for k, v in ALIAS_MAP.items()}
+
+
+_source_cache = None
+_source_cache_lock = threading.Lock()
+
+
+def _mtime_or_none(path):
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+
+def _cached_source(key, mtime_paths, compute):
+    """Return compute() as a set, cached on disk across program runs.
+
+    The cached value is reused as long as the mtimes of mtime_paths are
+    unchanged, so e.g. pacman is only re-run after the package database
+    actually changed. A cache hit is a small JSON read instead of a
+    subprocess spawn.
+    """
+    global _source_cache
+    with _source_cache_lock:
+        if _source_cache is None:
+            try:
+                with open(SOURCE_CACHE_FILE, "r") as f:
+                    _source_cache = json.load(f)
+            except Exception:
+                _source_cache = {}
+        mtimes = {p: _mtime_or_none(p) for p in mtime_paths}
+        entry = _source_cache.get(key)
+        if isinstance(entry, dict) and entry.get("mtimes") == mtimes:
+            return set(entry.get("values", []))
+
+    values = compute()
+
+    with _source_cache_lock:
+        _source_cache[key] = {"mtimes": mtimes, "values": sorted(values)}
+        try:
+            os.makedirs(os.path.dirname(SOURCE_CACHE_FILE), exist_ok=True)
+            with open(SOURCE_CACHE_FILE, "w") as f:
+                json.dump(_source_cache, f)
+        except Exception:
+            pass
+    return values
+
+
+def _query_installed_packages():
+    # Each installed package is a "name-version-release" directory in the
+    # local pacman database, so scanning it directly gives the same list
+    # as `pacman -Qq` without forking pacman at all.
+    try:
+        with os.scandir("/var/lib/pacman/local") as it:
+            return {normalize(e.name.rsplit("-", 2)[0]) for e in it if e.is_dir()}
+    except OSError:
+        pass
+    # Fallback for systems where the database is unreadable or laid out
+    # differently. Streaming the pipe line by line normalizes names while
+    # pacman is still writing, instead of buffering the whole output and
+    # scanning it a second time with splitlines().
+    if not shutil.which("pacman"):
+        return set()
     try:
-        result = subprocess.run(["pacman", "-Qq"], stdout=subprocess.PIPE, text=True, check=True, env=SUBPROCESS_ENV)
-        return {normalize(pkg) for pkg in result.stdout.splitlines()}
-    except (subprocess.CalledProcessError, FileNotFoundError):
+        with subprocess.Popen(["pacman", "-Qq"], stdout=subprocess.PIPE, text=True, env=SUBPROCESS_ENV) as p:
+            pkgs = {normalize(line.rstrip()) for line in p.stdout}
+        return pkgs if p.returncode == 0 else set()
+    except FileNotFoundError:
         return set()
 
 
-_flatpak_raw_cache = None
+@cache
+def get_installed_packages():
+    return _cached_source("pacman", ("/var/lib/pacman/local",), _query_installed_packages)
 
 
-def get_flatpak_ids_raw():
-    global _flatpak_raw_cache
-    if _flatpak_raw_cache is not None:
-        return _flatpak_raw_cache
+def _query_flatpak_ids_raw():
+    # Installed flatpak application IDs are the directory names under the
+    # per-user and system app dirs; reading those directly skips the
+    # flatpak runtime startup (one to two seconds on a cold cache).
+    ids = set()
+    found_dir = False
+    for app_dir in (os.path.join(HOME, ".local", "share", "flatpak", "app"), "/var/lib/flatpak/app"):
+        try:
+            with os.scandir(app_dir) as it:
+                ids.update(e.name for e in it if e.is_dir())
+            found_dir = True
+        except OSError:
+            pass
+    if found_dir or not shutil.which("flatpak"):
+        return ids
     try:
-        result = subprocess.run(
+        with subprocess.Popen(
             ["flatpak", "list", "--app", "--columns=application"],
-            stdout=subprocess.PIPE, text=True, check=True, env=SUBPROCESS_ENV
-        )
-        _flatpak_raw_cache = {x.strip() for x in result.stdout.splitlines() if x.strip()}
-    except (FileNotFoundError, subprocess.CalledProcessError):
-        _flatpak_raw_cache = set()
-    return _flatpak_raw_cache
+            stdout=subprocess.PIPE, text=True, env=SUBPROCESS_ENV
+        ) as p:
+            ids = {line.strip() for line in p.stdout if line.strip()}
+        return ids if p.returncode == 0 else set()
+    except FileNotFoundError:
+        return set()
+
+
+@cache
+def get_flatpak_ids_raw():
+    return _cached_source(
+        "flatpak",
+        (os.path.join(HOME, ".local", "share", "flatpak", "app"), "/var/lib/flatpak/app"),
+        _query_flatpak_ids_raw,
+    )
 
 
+@cache
 def get_flatpaks():
     return {normalize(app) for app in get_flatpak_ids_raw()}
 
@@ -203,58 +330,207 @@ def format_size(num_bytes):
     return f"{size:.1f} TB"
 
 
+@cache
 def get_appimages():
     appimage_dir = os.path.join(HOME, "Applications")
     apps = set()
     if os.path.isdir(appimage_dir):
-        for f in os.listdir(appimage_dir):
-            if f.lower().endswith(".appimage"):
-                apps.add(normalize(os.path.splitext(f)[0]))
+        with os.scandir(appimage_dir) as it:
+            for e in it:
+                if e.name.lower().endswith(".appimage"):
+                    apps.add(normalize(os.path.splitext(e.name)[0]))
     return apps
 
 
+@cache
 def get_installed_commands():
     cmds = set()
-    for path in os.environ.get("PATH", "").split(os.pathsep):
-        if os.path.isdir(path):
-            cmds.update(os.listdir(path))
+    # dict.fromkeys dedupes while keeping order, so PATH entries repeated
+    # by snap/flatpak wrappers are only scanned once; EAFP around scandir
+    # replaces the separate isdir stat per entry.
+    for path in dict.fromkeys(os.environ.get("PATH", "").split(os.pathsep)):
+        try:
+            with os.scandir(path) as it:
+                cmds.update(e.name for e in it)
+        except OSError:
+            pass
     return cmds
 
 
-def get_desktop_apps():
+def _query_desktop_apps():
     apps = set()
     desktop_dir = "/usr/share/applications"
     if os.path.isdir(desktop_dir):
-        for f in os.listdir(desktop_dir):
-            if f.endswith(".desktop"):
-                apps.add(normalize(os.path.splitext(f)[0]))
+        with os.scandir(desktop_dir) as it:
+            for e in it:
+                if e.name.endswith(".desktop"):
+                    apps.add(normalize(os.path.splitext(e.name)[0]))
     return apps
 
 
-def get_aur_packages():
+@cache
+def get_desktop_apps():
+    return _cached_source("desktop", ("/usr/share/applications",), _query_desktop_apps)
+
+
+def _query_aur_packages():
+    # Foreign (AUR) packages are exactly what `pacman -Qqm` prints; AUR
+    # helpers like yay answer the same query after a much heavier startup,
+    # so pacman is asked directly.
+    if not shutil.which("pacman"):
+        return set()
     try:
-        result = subprocess.run(["yay", "-Qq"], stdout=subprocess.PIPE, text=True, check=True, env=SUBPROCESS_ENV)
-        return {normalize(pkg) for pkg in result.stdout.splitlines()}
-    except (FileNotFoundError, subprocess.CalledProcessError):
+        with subprocess.Popen(["pacman", "-Qqm"], stdout=subprocess.PIPE, text=True, env=SUBPROCESS_ENV) as p:
+            pkgs = {normalize(line.rstrip()) for line in p.stdout}
+        return pkgs if p.returncode == 0 else set()
+    except FileNotFoundError:
         return set()
 
 
-def prepare_folders():
-    folders = []
-    config_path = os.path.join(HOME, ".config")
-    if os.path.isdir(config_path):
-        folders.extend(os.path.join(config_path, f) for f in os.listdir(config_path))
+@cache
+def get_aur_packages():
+    # AUR helpers answer -Qq from the same local pacman database, so its
+    # mtime is the right invalidation key here too.
+    return _cached_source("aur", ("/var/lib/pacman/local",), _query_aur_packages)
+
+
+def load_pkg_desc_snapshot():
+    """Parse one full `pacman -Qi` dump into a {name: description} map.
+
+    Descriptions of installed packages are static for the session, so one
+    pacman fork replaces a `pacman -Qi <name>` subprocess per lookup —
+    and with pyalpm installed, even that single fork is skipped.
+    """
+    if pyalpm is not None:
+        try:
+            handle = pyalpm.Handle("/", "/var/lib/pacman")
+            return {pkg.name: pkg.desc or "" for pkg in handle.get_localdb().pkgcache}
+        except Exception:
+            pass
+    if not shutil.which("pacman"):
+        return {}
+    try:
+        with subprocess.Popen(["pacman", "-Qi"], stdout=subprocess.PIPE, text=True, env=SUBPROCESS_ENV) as p:
+            descs = {}
+            name = None
+            for line in p.stdout:
+                if ":" not in line:
+                    continue
+                label, val = line.split(":", 1)
+                label = label.strip().lower()
+                if label == "name":
+                    name = val.strip()
+                elif label == "description" and name:
+                    descs[name] = val.strip()
+        return descs if p.returncode == 0 else {}
+    except FileNotFoundError:
+        return {}
 
-    local_share = os.path.join(HOME, ".local", "share")
-    if os.path.isdir(local_share):
-        folders.extend(os.path.join(local_share, f) for f in os.listdir(local_share))
 
-    for f in os.listdir(HOME):
-        full_path = os.path.join(HOME, f)
-        if f.startswith('.') and os.path.isdir(full_path) and f not in ['.config', '.local']:
-            folders.append(full_path)
+def refresh_caches():
+    """Forget the per-session getter results so the next scan re-queries the system."""
+    for fn in (get_installed_packages, get_flatpak_ids_raw, get_flatpaks,
+               get_aur_packages, get_desktop_apps, get_appimages,
+               get_installed_commands):
+        fn.cache_clear()
+
+
+@lru_cache(maxsize=2048)
+def derive_name_candidates(folder_path):
+    """Derive the package-name candidates to look up for a folder.
+
+    Pure and deterministic per path, so repeated clicks on the same folder
+    reuse the memoized tuple instead of re-deriving it.
+    """
+    rel = os.path.relpath(folder_path, HOME) if folder_path.startswith(HOME) else folder_path
+    parts = [p for p in rel.split(os.sep) if p]
+    base = os.path.basename(folder_path)
+    # A handful of short strings: plain lists with one dict.fromkeys dedup
+    # at the end beat the hashing churn of two intermediate sets.
+    cand = []
+
+    for i, p in enumerate(parts):
+        if p == ".config" and i + 1 < len(parts):
+            cand.append(parts[i + 1])
+        if p == ".local" and i + 2 < len(parts) and parts[i + 1] == "share":
+            cand.append(parts[i + 2])
+
+    cand.append(base)
+    if base.startswith("."):
+        cand.append(base.lstrip("."))
+    alias = _ALIAS_MAP.get(normalize(base.lstrip('.')))
+    if alias:
+        cand.append(alias)
+
+    norm = [n for n in (c.strip().lower().replace(" ", "-") for c in cand)
+            if len(n) >= 2]
+    return tuple(sorted(dict.fromkeys(norm), key=len))
+
+
+def collect_all_sources():
+    """Run all six system-data getters concurrently and return their results.
+
+    The getters are independent and I/O-bound (subprocesses and directory
+    reads release the GIL), so a thread pool collapses the total wait from
+    the sum of their latencies to the slowest single getter.
+    """
+    getters = {
+        "pkgs": get_installed_packages,
+        "aur": get_aur_packages,
+        "flatpaks": get_flatpaks,
+        "cmds": get_installed_commands,
+        "desktop": get_desktop_apps,
+        "appimages": get_appimages,
+    }
+    with ThreadPoolExecutor(max_workers=len(getters)) as pool:
+        futures = {name: pool.submit(fn) for name, fn in getters.items()}
+        return {name: fut.result() for name, fut in futures.items()}
+
+
+class SubstringIndex:
+    """Answers "is `name` a substring of any entry?" with one C-level scan.
+
+    The entries (already normalized by the getters) are joined into a
+    single NUL-separated string, so a query is one CPython substring
+    search over the blob instead of a Python-level loop over thousands
+    of names. NUL never appears in package names, so a match can never
+    span two entries.
+    """
+
+    def __init__(self, entries):
+        # Exact hits (folder named exactly like the app) are the common
+        # case; the O(1) set probe short-circuits the blob scan for them.
+        self._exact = frozenset(entries)
+        self._blob = "\x00".join(self._exact)
+
+    def __contains__(self, name):
+        return name in self._exact or name in self._blob
+
+
+def _dir_entries(path):
+    try:
+        yield from os.scandir(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return
+
 
-    return [f for f in folders if os.path.isdir(f) and not is_ignored(f)]
+def _hidden_home_entries():
+    for e in _dir_entries(HOME):
+        if e.name.startswith('.') and e.name not in _EXCLUDED_HIDDEN:
+            yield e
+
+
+def prepare_folders():
+    # os.scandir answers is_dir() from the d_type the kernel already returned
+    # with the directory listing, so no extra stat() syscall per entry is
+    # needed anywhere in the enumeration.
+    entries = itertools.chain(
+        _dir_entries(CONFIG_DIR),
+        _dir_entries(LOCAL_SHARE_DIR),
+        _hidden_home_entries(),
+    )
+    return [e.path for e in entries
+            if e.is_dir(follow_symlinks=False) and not is_ignored(e.path)]
 
 
 # =========================================================
@@ -314,20 +590,38 @@ class OrphyCleanerWindow(Adw.ApplicationWindow):
         except Exception:
             self.pkg_descriptions = {}
 
+        self._cache_dirty = False
+        self._cache_flush_id = 0
+
         self.aur_last_query = {}
         self.aur_backoff_base = 10
         self.aur_backoff_max = 300
 
-        self.results = {cat: [] for cat in CATEGORY_STYLES.keys()}
+        # Helper binaries do not appear or vanish mid-session; resolve
+        # them once instead of a shutil.which PATH walk per lookup.
+        self._aur_helper = next((h for h in ("yay", "paru") if shutil.which(h)), None)
+        self._has_flatpak = bool(shutil.which("flatpak"))
+        self._pkg_desc_map = None  # built on first description lookup
+
+        # Dicts double as insertion-ordered sets: membership and removal
+        # are O(1), so keep/unkeep/delete stay flat however large a
+        # category grows.
+        self.results = {cat: {} for cat in CATEGORY_STYLES.keys()}
         self.current_category = None
         self.kept_file = KEPT_FILE
+        self._kept_log_lines = 0
 
         self.folder_items = {}          # path -> FolderItem (shared across categories)
+        self._folder_category = {}      # path -> category it currently lives in
         self.category_rows = {}         # category -> sidebar Adw.ActionRow
         self.category_count_labels = {}  # category -> count Gtk.Label
         self.folder_row_by_path = {}    # path -> FolderRow currently shown in the list
+        self._rows_loaded = 0           # rows materialized for the current category
         self.sizing_in_progress = set()
         self._switching_category = False
+        self._refresh_pending = False
+        self._pending_count_refresh = set()
+        self._pending_select_index = None
 
         self._build_actions()
         self._build_ui()
@@ -358,9 +652,45 @@ class OrphyCleanerWindow(Adw.ApplicationWindow):
             pass
 
     def _on_close_request(self, *args):
+        self._flush_cache()
+        if self._kept_log_lines != len(self.results["Kept"]):
+            self.save_kept_folders()
         self._save_settings()
         return False  # allow the window to close
 
+    # =========================================================
+    # DESCRIPTION CACHE PERSISTENCE
+    # =========================================================
+    def _mark_cache_dirty(self):
+        # Debounce: each lookup pushes the flush 500 ms into the future, so
+        # a burst of N resolutions costs one serialization, not N.
+        self._cache_dirty = True
+        if self._cache_flush_id:
+            GLib.source_remove(self._cache_flush_id)
+        self._cache_flush_id = GLib.timeout_add(500, self._flush_cache)
+        return False  # one-shot when reached via idle_add
+
+    def _flush_cache(self):
+        self._cache_flush_id = 0
+        if not self._cache_dirty:
+            return False
+        # Write-then-rename so a crash mid-write never truncates the cache.
+        tmp_file = self.cache_file + ".tmp"
+        try:
+            # dumps encodes everything in one C pass; json.dump would issue
+            # a small f.write per token. Compact output — nobody reads the
+            # cache file by hand, and it halves the bytes written.
+            data = json.dumps(self.pkg_descriptions).encode("utf-8")
+            # Binary mode skips the TextIOWrapper layer; the whole payload
+            # goes out in a single write() regardless of size.
+            with open(tmp_file, "wb", buffering=1 << 20) as f:
+                f.write(data)
+            os.replace(tmp_file, self.cache_file)
+            self._cache_dirty = False
+        except Exception:
+            pass
+        return False  # one-shot timeout
+
     # =========================================================
     # ACTIONS (win.*) - drives menu, context menu and keyboard shortcuts
     # =========================================================
@@ -538,20 +868,25 @@ class OrphyCleanerWindow(Adw.ApplicationWindow):
         search_bar_box.set_margin_end(8)
         self.search_entry = Gtk.SearchEntry(placeholder_text="Filter folders\u2026")
         self.search_entry.set_hexpand(True)
-        self.search_entry.connect("search-changed", lambda e: self.show_category(self.current_category))
+        # Filtering through the list box's filter func just toggles row
+        # visibility; rebuilding every row on each keystroke is not needed.
+        self.search_entry.connect("search-changed", self._on_search_changed)
         search_bar_box.append(self.search_entry)
         box.append(search_bar_box)
 
         scroller = Gtk.ScrolledWindow()
         scroller.set_vexpand(True)
         scroller.set_hexpand(True)
+        scroller.get_vadjustment().connect("value-changed", self._on_folder_scroll)
 
         self.folder_list = Gtk.ListBox()
         self.folder_list.add_css_class("boxed-list")
         self.folder_list.set_margin_start(8)
         self.folder_list.set_margin_end(8)
         self.folder_list.set_margin_bottom(8)
-        self.folder_list.set_selection_mode(Gtk.SelectionMode.SINGLE)
+        # MULTIPLE so a batch of orphans can be trashed in one action.
+        self.folder_list.set_selection_mode(Gtk.SelectionMode.MULTIPLE)
+        self.folder_list.set_filter_func(self._folder_filter_func)
         self.folder_list.connect("row-selected", self._on_folder_selected)
         self.folder_list.connect("row-activated", lambda lb, row: self.open_folder())
 
@@ -613,22 +948,36 @@ class OrphyCleanerWindow(Adw.ApplicationWindow):
     # BACKGROUND STARTUP
     # =========================================================
     def _load_system_data_thread(self):
-        installed_pkgs = get_installed_packages()
-        installed_aur = get_aur_packages()
-        installed_flatpaks = get_flatpaks()
-        installed_cmds = get_installed_commands()
-        desktop_apps = get_desktop_apps()
-        appimages = get_appimages()
+        sources = collect_all_sources()
+        installed_pkgs = sources["pkgs"]
+        installed_aur = sources["aur"]
+        installed_flatpaks = sources["flatpaks"]
+        installed_cmds = sources["cmds"]
+        desktop_apps = sources["desktop"]
+        appimages = sources["appimages"]
+
+        # Substring indexes are built here, off the main loop, so the scan
+        # thread only pays one trie walk per folder instead of a linear
+        # scan over every package/app name.
+        pkg_index = SubstringIndex(installed_pkgs)
+        flatpak_index = SubstringIndex(installed_flatpaks)
+        desktop_index = SubstringIndex(desktop_apps)
+        appimage_index = SubstringIndex(appimages)
 
         def apply():
-            self.installed_pkgs = installed_pkgs
-            self.installed_aur = installed_aur
-            self.installed_flatpaks = installed_flatpaks
-            self.installed_cmds = installed_cmds
-            self.desktop_apps = desktop_apps
-            self.appimages = appimages
-
-            self.load_kept_folders()
+            # Frozen: these are read-only lookup sets for the lifetime of
+            # the session, probed per folder during classification.
+            self.installed_pkgs = frozenset(installed_pkgs)
+            self.installed_aur = frozenset(installed_aur)
+            self.installed_flatpaks = frozenset(installed_flatpaks)
+            self.installed_cmds = frozenset(installed_cmds)
+            self.desktop_apps = frozenset(desktop_apps)
+            self.appimages = frozenset(appimages)
+            self.pkg_index = pkg_index
+            self.flatpak_index = flatpak_index
+            self.desktop_index = desktop_index
+            self.appimage_index = appimage_index
+
             self.scan_status_label.set_label("Scanning folders\u2026")
             threading.Thread(target=self._scan_thread, daemon=True).start()
             return False
@@ -641,38 +990,70 @@ class OrphyCleanerWindow(Adw.ApplicationWindow):
     def load_kept_folders(self):
         if os.path.exists(self.kept_file):
             with open(self.kept_file, "r") as f:
-                for line in f:
-                    path = line.strip()
-                    if os.path.isdir(path):
-                        self.results["Kept"].append(path)
+                lines = f.read().splitlines()
+            # Replay the append-only log: plain lines add a path, a "-"
+            # prefix retracts it. Legacy files have only plain lines, so
+            # they replay unchanged.
+            live = {}
+            for line in lines:
+                path = line.strip()
+                if not path:
+                    continue
+                if path.startswith("-"):
+                    live.pop(path[1:], None)
+                else:
+                    live[path] = None
+            self._kept_log_lines = len(lines)
+            if not live:
+                return
+            # One stat() per kept path; fan the checks out over a pool so
+            # a kept list of thousands overlaps its syscalls instead of
+            # issuing them back to back.
+            with ThreadPoolExecutor() as pool:
+                checks = zip(live, pool.map(os.path.isdir, live))
+                for path, is_dir in checks:
+                    if is_dir:
+                        self.results["Kept"][path] = None
+                        self._folder_category[path] = "Kept"
 
     def _classify(self, folder):
         base = os.path.basename(folder)
-        name = ALIAS_MAP.get(base, normalize(base.lstrip('.')))
+        norm = normalize(base.lstrip('.'))
+        name = _ALIAS_MAP.get(norm, norm)
 
         if name in self.installed_pkgs:
             return "Installed (package match)"
         elif name in self.installed_cmds:
             return "Installed (executable found)"
-        elif any(name in app for app in self.installed_flatpaks):
+        elif name in self.flatpak_index:
             return "Installed (Flatpak)"
-        elif any(name in app for app in self.desktop_apps):
+        elif name in self.desktop_index:
             return "Installed (desktop file match)"
-        elif any(name in app for app in self.appimages):
+        elif name in self.appimage_index:
             return "Installed (AppImage)"
-        elif any(name in pkg for pkg in self.installed_pkgs):
+        elif name in self.pkg_index:
             return "Maybe Installed (partial package match)"
         else:
             return "Orphaned"
 
     def _scan_thread(self):
+        # Replaying the kept log stats every kept path, so it happens
+        # here on the worker rather than blocking the main loop.
+        self.load_kept_folders()
         total = len(self.folders_to_scan)
-        kept_set = set(self.results["Kept"])
+        kept = self.results["Kept"]
+        # Classification is microseconds per folder; an idle callback per
+        # folder would cost far more than the work itself. Report progress
+        # once per batch so the main loop only redraws every 32 folders.
+        batch = 32
         for i, folder in enumerate(self.folders_to_scan):
-            if folder not in kept_set:
+            if folder not in kept:
                 cat = self._classify(folder)
-                self.results[cat].append(folder)
-            GLib.idle_add(self._update_scan_progress, i + 1, total, folder)
+                self.results[cat][folder] = None
+                self._folder_category[folder] = cat
+            done = i + 1
+            if done % batch == 0 or done == total:
+                GLib.idle_add(self._update_scan_progress, done, total, folder)
         GLib.idle_add(self._on_scan_complete)
 
     def _update_scan_progress(self, done, total, folder):
@@ -723,19 +1104,18 @@ class OrphyCleanerWindow(Adw.ApplicationWindow):
         if target_row is not None and self.category_list.get_selected_row() is not target_row:
             self.category_list.select_row(target_row)
 
-        query = self.search_entry.get_text().strip().lower()
-        folders = self.results.get(category, [])
-        if query:
-            folders = [f for f in folders if query in f.lower()]
+        folders = self.results.get(category, ())
 
-        for path in folders:
-            item = self.folder_items.get(path)
-            if item is None:
-                item = FolderItem(path)
-                self.folder_items[path] = item
-            row = FolderRow(item)
-            self.folder_list.append(row)
-            self.folder_row_by_path[path] = row
+        # Only the first chunk of rows is materialized here; scrolling (or
+        # searching) appends the rest, so switching to a category with
+        # thousands of folders stays instantaneous. With an active search
+        # the filter can only hide rows that exist, so load them all —
+        # otherwise matches beyond the first chunk would be unreachable.
+        self._rows_loaded = 0
+        if self.search_entry.get_text().strip():
+            self._append_folder_rows(count=None)
+        else:
+            self._append_folder_rows()
 
         if category == "Orphaned":
             self.keep_button.set_label("Keep")
@@ -773,26 +1153,55 @@ class OrphyCleanerWindow(Adw.ApplicationWindow):
         self._refresh_category_count(category)
         return False
 
+    def _append_folder_rows(self, count=LIST_CHUNK_SIZE):
+        folders = self.results.get(self.current_category, ())
+        end = len(folders) if count is None else min(self._rows_loaded + count, len(folders))
+        for path in itertools.islice(folders, self._rows_loaded, end):
+            item = self.folder_items.get(path)
+            if item is None:
+                item = FolderItem(path)
+                self.folder_items[path] = item
+            row = FolderRow(item)
+            self.folder_list.append(row)
+            self.folder_row_by_path[path] = row
+        self._rows_loaded = end
+
+    def _on_folder_scroll(self, adjustment):
+        near_bottom = (adjustment.get_value() + adjustment.get_page_size()
+                       >= adjustment.get_upper() - 600)
+        if near_bottom:
+            self._append_folder_rows()
+
+    def _on_search_changed(self, entry):
+        if entry.get_text().strip():
+            # The filter func only sees materialized rows, so load the rest
+            # of the category before filtering.
+            self._append_folder_rows(count=None)
+        self.folder_list.invalidate_filter()
+
+    def _folder_filter_func(self, row):
+        query = self.search_entry.get_text().strip().lower()
+        return not query or query in row.item.path.lower()
+
     def _on_folder_selected(self, listbox, row):
         pass  # selection tracked via listbox.get_selected_row() when needed
 
-    def _listbox_rows(self, listbox):
-        rows = []
-        child = listbox.get_first_child()
-        while child is not None:
-            rows.append(child)
-            child = child.get_next_sibling()
-        return rows
-
     def _selected_item(self):
-        row = self.folder_list.get_selected_row()
-        return row.item if row is not None else None
+        rows = self.folder_list.get_selected_rows()
+        return rows[0].item if rows else None
+
+    def _selected_items(self):
+        return [row.item for row in self.folder_list.get_selected_rows()]
 
     def _on_folder_right_click(self, gesture, n_press, x, y):
         row = self.folder_list.get_row_at_y(int(y))
         if row is None:
             return
-        self.folder_list.select_row(row)
+        # File-manager behavior: right-clicking inside an existing
+        # multi-selection keeps it; outside, it becomes the selection.
+        if not row.is_selected():
+            self.folder_list.unselect_all()
+            self.folder_list.select_row(row)
 
         menu = Gio.Menu()
         menu.append("Open Folder", "win.open-folder")
@@ -831,48 +1240,27 @@ class OrphyCleanerWindow(Adw.ApplicationWindow):
         if not text:
             return None
         for line in text.splitlines():
-            if ":" in line:
-                label, val = line.split(":", 1)
-                lab = label.strip().lower()
-                if "description" in lab or "popis" in lab:
-                    return val.strip()
+            m = _DESC_LABEL_RE.match(line)
+            if m:
+                return m.group(1).strip()
         return None
 
-    def _parse_desc_from_ss(self, text, wanted_name):
-        if not text:
-            return None
-        lines = text.splitlines()
-        wanted_name = wanted_name.strip().lower()
-        for i, line in enumerate(lines):
-            line = line.strip("\n")
-            if not line or line.startswith("==>") or "matches found" in line.lower():
-                continue
-            if re.search(r"/" + re.escape(wanted_name) + r"\b", line.lower()):
-                if i + 1 < len(lines):
-                    nxt = lines[i + 1]
-                    if nxt.startswith("    ") or nxt.startswith("\t"):
-                        return nxt.strip()
-        for line in lines:
-            if line.startswith("    ") or line.startswith("\t"):
-                val = line.strip()
-                if val and "matches found" not in val.lower():
-                    return val
-        return None
+    def _pkg_desc_snapshot(self):
+        # Lazily built on the description worker thread; a duplicate build
+        # from a racing lookup is harmless and only costs one extra fork.
+        if self._pkg_desc_map is None:
+            self._pkg_desc_map = load_pkg_desc_snapshot()
+        return self._pkg_desc_map
 
     def _search_pacman(self, name):
-        out = self._run_cmd(["pacman", "-Qi", name], timeout=2)
-        desc = self._parse_desc_from_qi_or_si(out)
+        desc = self._pkg_desc_snapshot().get(name)
         if desc:
             return desc
+        # -Si is already an exact-name lookup across all sync repos; if it
+        # finds nothing, an anchored -Ss regex search cannot either, so the
+        # slow full-database grep is not worth a third subprocess.
         out = self._run_cmd(["pacman", "-Si", name], timeout=8)
-        desc = self._parse_desc_from_qi_or_si(out)
-        if desc:
-            return desc
-        out = self._run_cmd(["pacman", "-Ss", f"^{name}$"], timeout=8)
-        desc = self._parse_desc_from_ss(out, name)
-        if desc:
-            return desc
-        return None
+        return self._parse_desc_from_qi_or_si(out)
 
     def _search_aur(self, pkg_name):
         cache_key = f"aur:{pkg_name}"
@@ -886,11 +1274,8 @@ class OrphyCleanerWindow(Adw.ApplicationWindow):
         if now - last_attempt < backoff:
             return None
 
-        if shutil.which("yay"):
-            helper = "yay"
-        elif shutil.which("paru"):
-            helper = "paru"
-        else:
+        helper = self._aur_helper
+        if helper is None:
             self.pkg_descriptions[cache_key] = "<not found>"
             return None
 
@@ -935,7 +1320,7 @@ class OrphyCleanerWindow(Adw.ApplicationWindow):
                 return None
             return self.pkg_descriptions[cache_key]
 
-        if not shutil.which("flatpak"):
+        if not self._has_flatpak:
             self.pkg_descriptions[cache_key] = "<not found>"
             return None
 
@@ -979,31 +1364,6 @@ class OrphyCleanerWindow(Adw.ApplicationWindow):
         self.pkg_descriptions[cache_key] = "<not found>"
         return None
 
-    def _derive_name_candidates(self, folder_path):
-        rel = os.path.relpath(folder_path, HOME) if folder_path.startswith(HOME) else folder_path
-        parts = [p for p in rel.split(os.sep) if p]
-        base = os.path.basename(folder_path)
-        cand = set()
-
-        for i, p in enumerate(parts):
-            if p == ".config" and i + 1 < len(parts):
-                cand.add(parts[i + 1])
-            if p == ".local" and i + 2 < len(parts) and parts[i + 1] == "share":
-                cand.add(parts[i + 2])
-
-        cand.add(base)
-        if base.startswith("."):
-            cand.add(base.lstrip("."))
-        if base in ALIAS_MAP:
-            cand.add(ALIAS_MAP[base])
-
-        norm = set()
-        for c in cand:
-            n = c.strip().lower().replace(" ", "-")
-            if len(n) >= 2:
-                norm.add(n)
-        return sorted(norm, key=len)
-
     def load_description(self):
         threading.Thread(target=self._load_description_thread, daemon=True).start()
 
@@ -1020,31 +1380,37 @@ class OrphyCleanerWindow(Adw.ApplicationWindow):
 
         GLib.idle_add(self._update_desc_label, "Loading description\u2026")
 
-        candidates = self._derive_name_candidates(folder_path)
+        candidates = derive_name_candidates(folder_path)
         best_desc = None
         best_name = None
 
-        for cand in candidates:
-            for source, search_func in [
-                ("pacman", self._search_pacman),
-                ("aur", self._search_aur),
-                ("flatpak", self._search_flatpak),
-            ]:
-                cache_key = f"{source}:{cand}"
-                cached = self.pkg_descriptions.get(cache_key)
-                if cached and cached != "<not found>":
-                    best_desc, best_name = cached, cand
-                    break
+        # Pass 1 tries local pacman for every candidate first \u2014 those
+        # lookups are near-instant, so a later candidate with a local hit
+        # must not wait behind a slow AUR/flatpak probe of an earlier one.
+        search_passes = [
+            [("pacman", self._search_pacman)],
+            [("aur", self._search_aur), ("flatpak", self._search_flatpak)],
+        ]
+        for search_pass in search_passes:
+            for cand in candidates:
+                for source, search_func in search_pass:
+                    cache_key = f"{source}:{cand}"
+                    cached = self.pkg_descriptions.get(cache_key)
+                    if cached and cached != "<not found>":
+                        best_desc, best_name = cached, cand
+                        break
+
+                    GLib.idle_add(self._update_desc_label, f"Searching {source.upper()} for {cand}\u2026")
+                    desc = search_func(cand)
+                    if desc:
+                        best_desc, best_name = desc, cand
+                        self.pkg_descriptions[cache_key] = desc
+                        break
+                    else:
+                        self.pkg_descriptions[cache_key] = "<not found>"
 
-                GLib.idle_add(self._update_desc_label, f"Searching {source.upper()} for {cand}\u2026")
-                desc = search_func(cand)
-                if desc:
-                    best_desc, best_name = desc, cand
-                    self.pkg_descriptions[cache_key] = desc
+                if best_desc:
                     break
-                else:
-                    self.pkg_descriptions[cache_key] = "<not found>"
-
             if best_desc:
                 break
 
@@ -1053,11 +1419,9 @@ class OrphyCleanerWindow(Adw.ApplicationWindow):
             best_desc = "Description not found"
             self.pkg_descriptions[f"any:{best_name}"] = best_desc
 
-        try:
-            with open(self.cache_file, "w") as f:
-                json.dump(self.pkg_descriptions, f, indent=2)
-        except Exception:
-            pass
+        # Schedule the debounced flush from the main loop — GLib sources
+        # must be added/removed on the thread that owns them.
+        GLib.idle_add(self._mark_cache_dirty)
 
         GLib.idle_add(self._update_desc_label, f"{best_name}: {best_desc}")
 
@@ -1068,59 +1432,123 @@ class OrphyCleanerWindow(Adw.ApplicationWindow):
         self.toast_overlay.add_toast(Adw.Toast(title=text, timeout=4))
 
     def move_folder_between_categories(self, src_category, dst_category):
+        """Move every selected folder from src to dst; return the moved paths."""
         if self.current_category != src_category:
-            return None
-        item = self._selected_item()
-        if item is None:
-            return None
-        folder = item.path
-        if folder not in self.results.get(src_category, []):
-            return None
+            return []
+        folders = [item.path for item in self._selected_items()
+                   if self._folder_category.get(item.path) == src_category]
+        if not folders:
+            return []
 
-        prev_index = self._listbox_rows(self.folder_list).index(self.folder_list.get_selected_row())
+        rows = self.folder_list.get_selected_rows()
+        prev_index = rows[0].get_index() if rows else 0
 
-        self.results[src_category].remove(folder)
-        self.results.setdefault(dst_category, []).append(folder)
-        self.show_category(src_category)
-        self._refresh_category_count(dst_category)
-        self._select_row_near_index(prev_index)
-        return folder
+        results = self.results
+        src = results[src_category]
+        dst = results.setdefault(dst_category, {})
+        for folder in folders:
+            del src[folder]
+            dst[folder] = None
+            self._folder_category[folder] = dst_category
+        self._pending_count_refresh.update((src_category, dst_category))
+        self._pending_select_index = prev_index
+        self._request_refresh()
+        return folders
+
+    def _request_refresh(self):
+        # Coalesce rebuilds: a burst of keep/unkeep/delete actions (say, a
+        # held keyboard shortcut) queues one idle rebuild instead of one
+        # synchronous rebuild per action.
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        GLib.idle_add(self._do_refresh)
+
+    def _do_refresh(self):
+        self._refresh_pending = False
+        for cat in self._pending_count_refresh:
+            self._refresh_category_count(cat)
+        self._pending_count_refresh.clear()
+        self.show_category(self.current_category)
+        if self._pending_select_index is not None:
+            # show_category materializes only the first chunk; extend the
+            # list until the target row exists, or restoring a selection
+            # made deep in the list would snap back to the chunk boundary.
+            total = len(self.results.get(self.current_category, ()))
+            while self._rows_loaded <= self._pending_select_index and self._rows_loaded < total:
+                self._append_folder_rows()
+            self._select_row_near_index(self._pending_select_index)
+            self._pending_select_index = None
+        return False
 
     def _select_row_near_index(self, index):
-        rows = self._listbox_rows(self.folder_list)
-        if not rows:
-            return
-        target = rows[min(index, len(rows) - 1)]
-        self.folder_list.select_row(target)
+        row = self.folder_list.get_row_at_index(index)
+        while row is None and index > 0:
+            index -= 1
+            row = self.folder_list.get_row_at_index(index)
+        if row is not None:
+            self.folder_list.select_row(row)
 
     def keep_folder(self):
-        folder = self.move_folder_between_categories("Orphaned", "Kept")
-        if folder:
-            self.save_kept_folders()
-            self._toast(f"Kept {os.path.basename(folder)}")
+        folders = self.move_folder_between_categories("Orphaned", "Kept")
+        if not folders:
+            return
+        self._append_kept_log(*folders)
+        if len(folders) == 1:
+            self._toast(f"Kept {os.path.basename(folders[0])}")
+        else:
+            self._toast(f"Kept {len(folders)} folders")
 
     def unkeep_folder(self):
-        folder = self.move_folder_between_categories("Kept", "Orphaned")
-        if folder:
+        folders = self.move_folder_between_categories("Kept", "Orphaned")
+        if not folders:
+            return
+        self._append_kept_log(*("-" + folder for folder in folders))
+        if len(folders) == 1:
+            self._toast(f"Unkept {os.path.basename(folders[0])}")
+        else:
+            self._toast(f"Unkept {len(folders)} folders")
+
+    def _append_kept_log(self, *lines):
+        # One O(1) append per action instead of rewriting the whole file;
+        # load_kept_folders replays the log and a "-" prefix retracts.
+        try:
+            with open(self.kept_file, "a") as f:
+                f.write("".join(line + "\n" for line in lines))
+        except OSError:
+            return
+        self._kept_log_lines += len(lines)
+        if self._kept_log_lines > 2 * len(self.results["Kept"]) + 16:
             self.save_kept_folders()
-            self._toast(f"Unkept {os.path.basename(folder)}")
 
     def save_kept_folders(self):
-        with open(self.kept_file, "w") as f:
-            for fpath in self.results["Kept"]:
-                f.write(fpath + "\n")
+        """Compact the kept-folders log down to the live entries."""
+        kept = self.results["Kept"]
+        data = "\n".join(kept) + ("\n" if kept else "")
+        # Same write-then-rename as _flush_cache: a crash mid-compaction
+        # must not truncate the only copy of the kept list.
+        tmp_file = self.kept_file + ".tmp"
+        with open(tmp_file, "wb") as f:
+            f.write(data.encode("utf-8"))
+        os.replace(tmp_file, self.kept_file)
+        self._kept_log_lines = len(kept)
 
     def open_folder(self):
         item = self._selected_item()
         if item is None:
             return
-        if not shutil.which("xdg-open"):
-            self._toast("xdg-open was not found on this system.")
-            return
+        # Gtk.FileLauncher resolves the handler through the portal — no
+        # xdg-open fork and its desktop-detection shell probe per click,
+        # and the file manager gets a proper activation token (same
+        # mechanism as open_help's Gtk.UriLauncher).
+        launcher = Gtk.FileLauncher(file=Gio.File.new_for_path(item.path))
+        launcher.launch(self, None, self._on_file_launched)
+
+    def _on_file_launched(self, launcher, result):
         try:
-            subprocess.Popen(["xdg-open", item.path])
-        except Exception as e:
-            self._toast(f"Could not open folder: {e}")
+            launcher.launch_finish(result)
+        except GLib.Error as e:
+            self._toast(f"Could not open folder: {e.message}")
 
     def open_help(self):
         # Gtk.UriLauncher passes a proper activation token to the compositor
@@ -1155,20 +1583,26 @@ class OrphyCleanerWindow(Adw.ApplicationWindow):
         about.present()
 
     def delete_folder(self):
-        item = self._selected_item()
-        if item is None:
-            return
         if self.current_category != "Orphaned":
             self._toast("Only Orphaned folders can be deleted.")
             return
-        folder = item.path
+        folders = [item.path for item in self._selected_items()
+                   if self._folder_category.get(item.path) == "Orphaned"]
+        if not folders:
+            return
 
         has_trash = bool(shutil.which("gio"))
         heading = "Confirm Delete" if has_trash else "Confirm Permanent Delete"
+        what = ("this folder" if len(folders) == 1
+                else f"these {len(folders)} folders")
+        # Ctrl+A can select thousands of rows; keep the dialog readable.
+        listing = "\n".join(folders[:12])
+        if len(folders) > 12:
+            listing += f"\n…and {len(folders) - 12} more"
         body = (
-            f"Are you sure you want to move this folder to Trash?\n\n{folder}"
+            f"Are you sure you want to move {what} to Trash?\n\n{listing}"
             if has_trash else
-            f"Trash is not available.\n\nAre you sure you want to permanently delete this folder?\n\n{folder}"
+            f"Trash is not available.\n\nAre you sure you want to permanently delete {what}?\n\n{listing}"
         )
 
         dialog = Adw.MessageDialog(
@@ -1179,30 +1613,65 @@ class OrphyCleanerWindow(Adw.ApplicationWindow):
         dialog.set_response_appearance("delete", Adw.ResponseAppearance.DESTRUCTIVE)
         dialog.set_default_response("cancel")
         dialog.set_close_response("cancel")
-        dialog.connect("response", self._on_delete_confirmed, folder, has_trash)
+        dialog.connect("response", self._on_delete_confirmed, folders, has_trash)
         dialog.present()
 
-    def _on_delete_confirmed(self, dialog, response, folder, has_trash):
+    def _on_delete_confirmed(self, dialog, response, folders, has_trash):
         if response != "delete":
             return
+        rows = self.folder_list.get_selected_rows()
+        prev_index = rows[0].get_index() if rows else 0
+        # Unlinking a large cache tree can take seconds; run it on a
+        # worker so the main loop keeps painting, then update the list
+        # from an idle callback once the walk finishes.
+        threading.Thread(
+            target=self._delete_thread, args=(folders, has_trash, prev_index),
+            daemon=True,
+        ).start()
+
+    def _delete_thread(self, folders, has_trash, prev_index):
+        error = None
         if has_trash:
-            result = subprocess.run(["gio", "trash", folder], stderr=subprocess.PIPE, text=True)
+            # gio takes multiple paths, so a batch of N selected folders
+            # costs one fork/exec instead of N.
+            result = subprocess.run(["gio", "trash", *folders], stderr=subprocess.PIPE, text=True)
+            if result.returncode != 0:
+                error = result.stderr.strip()
         else:
-            result = subprocess.run(["rm", "-rf", folder], stderr=subprocess.PIPE, text=True)
-
-        if result.returncode != 0:
-            self._toast(f"Could not delete folder: {result.stderr.strip()}")
-            return
-
-        selected_row = self.folder_list.get_selected_row()
-        prev_index = self._listbox_rows(self.folder_list).index(selected_row) if selected_row else 0
+            # rmtree walks the tree in-process with unlink/rmdir — no
+            # fork/exec at all, and no surprise if rm is missing. Keep
+            # going past failures; the remaining folders are independent.
+            for folder in folders:
+                try:
+                    shutil.rmtree(folder)
+                except OSError as e:
+                    error = str(e)
+        if error:
+            # Both branches delete what they can before failing, so prune
+            # whatever actually left the disk or the list would keep
+            # showing folders that no longer exist.
+            deleted = [f for f in folders if not os.path.isdir(f)]
+        else:
+            deleted = folders
+        GLib.idle_add(self._on_delete_done, deleted, prev_index, error)
 
-        if folder in self.results.get("Orphaned", []):
-            self.results["Orphaned"].remove(folder)
-        self.folder_items.pop(folder, None)
-        self.show_category("Orphaned")
-        self._select_row_near_index(prev_index)
-        self._toast(f"Deleted {os.path.basename(folder)}")
+    def _on_delete_done(self, folders, prev_index, error):
+        orphaned = self.results["Orphaned"]
+        for folder in folders:
+            orphaned.pop(folder, None)
+            self._folder_category.pop(folder, None)
+            self.folder_items.pop(folder, None)
+        if folders:
+            self._pending_count_refresh.add("Orphaned")
+            self._pending_select_index = prev_index
+            self._request_refresh()
+        if error:
+            self._toast(f"Could not delete folder: {error}")
+        elif len(folders) == 1:
+            self._toast(f"Deleted {os.path.basename(folders[0])}")
+        else:
+            self._toast(f"Deleted {len(folders)} folders")
+        return False
 
     def export_orphaned_list(self):
         folders = self.results.get("Orphaned", [])